@@ -13,22 +13,61 @@ directory for licensing information.
 Marabou defines key functions that make up the main user interface to Maraboupy
 '''
 
+import concurrent.futures
+import functools
+import importlib
+import mmap as _mmap
+import os
+import typing
 import warnings
-from maraboupy.MarabouCore import *
-
-# Import parsers if required packages are installed
-try:
-    from maraboupy.MarabouNetworkNNet import *
-except ImportError:
-    warnings.warn("NNet parser is unavailable because the numpy package is not installed")
-try:
-    from maraboupy.MarabouNetworkTF import *
-except ImportError:
-    warnings.warn("Tensorflow parser is unavailable because tensorflow package is not installed")
-try:
-    from maraboupy.MarabouNetworkONNX import *
-except ImportError:
-    warnings.warn("ONNX parser is unavailable because onnx or onnxruntime packages are not installed")
+from maraboupy import MarabouCore
+from maraboupy.MarabouCore import InputQuery, Options, Statistics
+
+__all__ = ["read_nnet", "read_tf", "read_onnx", "load_query", "solve_query", "solve_queries",
+           "IncrementalSolver", "SolveResult", "createOptions", "InputQuery", "Options", "Statistics"]
+
+# Parsers are imported on first use, since their dependencies (numpy, tensorflow, onnx)
+# are expensive to import and are not needed to load or solve a serialized query
+_PARSERS = {
+    "MarabouNetworkNNet": ("maraboupy.MarabouNetworkNNet",
+                           "NNet parser is unavailable because the numpy package is not installed"),
+    "MarabouNetworkTF": ("maraboupy.MarabouNetworkTF",
+                         "Tensorflow parser is unavailable because tensorflow package is not installed"),
+    "MarabouNetworkONNX": ("maraboupy.MarabouNetworkONNX",
+                           "ONNX parser is unavailable because onnx or onnxruntime packages are not installed"),
+}
+_warnedParsers = set()
+
+def _importParser(name):
+    """Import the parser module backing the given network class and return the class
+
+    Args:
+        name (str): Name of the network class, one of the keys of _PARSERS
+
+    Returns:
+        (type): The network class
+
+    :meta private:
+    """
+    moduleName, message = _PARSERS[name]
+    try:
+        module = importlib.import_module(moduleName)
+    except ImportError:
+        if name not in _warnedParsers:
+            _warnedParsers.add(name)
+            warnings.warn(message)
+        raise
+    cls = getattr(module, name)
+    globals()[name] = cls
+    return cls
+
+def __getattr__(name):
+    if name in _PARSERS:
+        try:
+            return _importParser(name)
+        except ImportError as error:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name)) from error
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 def read_nnet(filename, normalize=False):
     """Constructs a MarabouNetworkNnet object from a .nnet file
@@ -41,7 +80,7 @@ def read_nnet(filename, normalize=False):
     Returns:
         :class:`~maraboupy.MarabouNetworkNNet.MarabouNetworkNNet`
     """
-    return MarabouNetworkNNet(filename, normalize=normalize)
+    return _importParser("MarabouNetworkNNet")(filename, normalize=normalize)
 
 
 def read_tf(filename, inputNames=None, outputNames=None, modelType="frozen", savedModelTags=[]):
@@ -59,35 +98,139 @@ def read_tf(filename, inputNames=None, outputNames=None, modelType="frozen", sav
     Returns:
         :class:`~maraboupy.MarabouNetworkTF.MarabouNetworkTF`
     """
-    return MarabouNetworkTF(filename, inputNames, outputNames, modelType, savedModelTags)
+    return _importParser("MarabouNetworkTF")(filename, inputNames, outputNames, modelType, savedModelTags)
 
-def read_onnx(filename, inputNames=None, outputNames=None):
+def read_onnx(filename, inputNames=None, outputNames=None, lazy=True, cacheExtracted=False):
     """Constructs a MarabouNetworkONNX object from an ONNX file
 
     Args:
         filename (str): Path to the ONNX file
         inputNames (list of str, optional): List of node names corresponding to inputs
         outputNames (list of str, optional): List of node names corresponding to outputs
+        lazy (bool, optional): If true, initializers stored as external data are only read from disk
+            when a node between the inputs and outputs uses them, defaults to True
+        cacheExtracted (bool, optional): If true and both inputNames and outputNames are given, parse the
+            part of the network between them from a model extracted once and cached on disk, defaults to False
 
     Returns:
         :class:`~maraboupy.MarabouNetworkONNX.MarabouNetworkONNX`
     """
-    return MarabouNetworkONNX(filename, inputNames, outputNames)
+    return _importParser("MarabouNetworkONNX")(filename, inputNames, outputNames, lazy, cacheExtracted)
 
-def load_query(filename):
+def load_query(filename, mmap=True, direct=False):
     """Load the serialized inputQuery from the given filename
 
     Args:
         filename (str): File to read for loading input query
+        mmap (bool, optional): If true, memory-map the file and parse it in place rather than
+            reading it into a heap buffer, defaults to True
+        direct (bool, optional): If true, read the file with O_DIRECT, bypassing the page cache.
+            Meant for benchmark harnesses that load many large query files once each, so that
+            they do not evict the solver's working set from the cache. Falls back to the
+            other modes where O_DIRECT is unavailable, defaults to False
 
     Returns:
         :class:`~maraboupy.MarabouCore.InputQuery`
     """
+    filename = os.fspath(filename)
+    # Empty or missing files go through loadQuery, which reports the error
+    if (mmap or direct) and os.path.isfile(filename):
+        size = os.path.getsize(filename)
+        if size > 0:
+            if direct:
+                buffer = _readDirect(filename, size)
+                if buffer is not None:
+                    with buffer, memoryview(buffer)[:size] as view:
+                        return MarabouCore.loadQueryFromBuffer(view)
+            if mmap:
+                with open(filename, "rb") as f:
+                    with _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as buffer:
+                        return MarabouCore.loadQueryFromBuffer(buffer)
     return MarabouCore.loadQuery(filename)
 
-def solve_query(ipq, filename="", verbose=True, options=None, propertyFilename=""):
+_DIRECT_CHUNK_SIZE = 1 << 20
+
+def _readDirect(filename, size):
+    """Read a file with O_DIRECT into a page-aligned anonymous mapping
+
+    Args:
+        filename (str): File to read
+        size (int): Size of the file in bytes
+
+    Returns:
+        (mmap.mmap): Mapping holding the file contents, or None if the platform or
+        file system does not support O_DIRECT
+
+    :meta private:
+    """
+    if not hasattr(os, "O_DIRECT") or not hasattr(os, "readv"):
+        return None
+    # O_DIRECT reads need aligned buffers and lengths: the mapping is page aligned, and
+    # its length and every chunk are multiples of the page size
+    length = -(-size // _mmap.PAGESIZE) * _mmap.PAGESIZE
+    buffer = _mmap.mmap(-1, length)
+    try:
+        fd = os.open(filename, os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        buffer.close()
+        return None
+    try:
+        with memoryview(buffer) as view:
+            offset = 0
+            while offset < size:
+                read = os.readv(fd, [view[offset:offset + _DIRECT_CHUNK_SIZE]])
+                if read == 0:
+                    break
+                offset += read
+    except OSError:
+        # Some file systems accept O_DIRECT on open but fail the reads
+        buffer.close()
+        return None
+    finally:
+        os.close(fd)
+    return buffer
+
+@functools.lru_cache(maxsize=128)
+def _parseProperty(propertyFilename, absolutePath, mtime, size):
+    """Read a property file once for all queries it is applied to
+
+    Args:
+        propertyFilename (str): Path to the property file, as given by the user and printed when applied
+        absolutePath (str): Absolute path to the property file, so that a relative path is read again
+                     from another working directory
+        mtime (int): Modification time of the file, so that a modified file is read again
+        size (int): Size of the file, so that a file rewritten within the timestamp granularity is read again
+
+    Returns:
+        :class:`~maraboupy.MarabouCore.Property`
+
+    :meta private:
+    """
+    return MarabouCore.parseProperty(propertyFilename)
+
+class SolveResult(typing.NamedTuple):
+    """Result of solving a query, which unpacks as the tuple (exitCode, vals, stats)
+
+    Attributes:
+        exitCode (str): A string representing the exit code (sat/unsat/TIMEOUT/ERROR/UNKNOWN/QUIT_REQUESTED)
+        vals (Dict[int, float]): Empty if UNSAT, otherwise the SATisfying values of the variables
+        stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
+    """
+    exitCode: str
+    vals: typing.Any
+    stats: Statistics
+
+def solve_query(ipq, filename="", verbose=True, options=None, propertyFilename="", vals_as_array=False):
     """Function to solve query represented by this network
 
+    The GIL is released while Marabou solves the query, and while :func:`~maraboupy.Marabou.load_query`
+    parses a query, so other Python threads keep running. Queries may be solved from several threads
+    at once, as long as each thread solves a different InputQuery and no filename is given (output
+    redirection applies to the whole process). Since Marabou's options are global, queries with the
+    same options are solved in parallel, while a query with different options waits until the queries
+    being solved finish. Loading a query while other threads solve is safe: the loader only waits for
+    a solve that is starting to finish setting its options.
+
     Args:
         ipq (:class:`~maraboupy.MarabouCore.InputQuery`): InputQuery object, which can be obtained from
                    :func:`~maraboupy.MarabouNetwork.getInputQuery` or :func:`~maraboupy.Marabou.load_query`
@@ -95,18 +238,24 @@ def solve_query(ipq, filename="", verbose=True, options=None, propertyFilename="
         verbose (bool, optional): Whether to print out solution after solve finishes, defaults to True
         options: (:class:`~maraboupy.MarabouCore.Options`): Object for specifying Marabou options
         propertyFilename (str, optional): Path to property file
+        vals_as_array (bool, optional): Return the satisfying assignment as a numpy array indexed by variable
+                   instead of a dictionary, avoiding the per-variable dictionary conversion, defaults to False
 
     Returns:
-        (tuple): tuple containing:
+        (:class:`~maraboupy.Marabou.SolveResult`): tuple containing:
             - exitCode (str): A string representing the exit code (sat/unsat/TIMEOUT/ERROR/UNKNOWN/QUIT_REQUESTED).
-            - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise a dictionary of SATisfying values for variables
+            - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise a dictionary of SATisfying values for variables.
+              If vals_as_array is True, a numpy array instead (empty if UNSAT)
             - stats (:class:`~maraboupy.MarabouCore.Statistics`, optional): A Statistics object to how Marabou performed
     """
     if propertyFilename:
-        MarabouCore.loadProperty(ipq, propertyFilename)
+        stat = os.stat(propertyFilename)
+        MarabouCore.applyProperty(ipq, _parseProperty(propertyFilename, os.path.abspath(propertyFilename),
+                                                      stat.st_mtime_ns, stat.st_size))
     if options is None:
-        options = createOptions()
-    exitCode, vals, stats = MarabouCore.solve(ipq, options, filename)
+        options = _defaultOptions()
+    solve = MarabouCore.solveArray if vals_as_array else MarabouCore.solve
+    exitCode, vals, stats = solve(ipq, options, filename)
     if verbose:
         if stats.hasTimedOut():
             print ("TO")
@@ -114,12 +263,74 @@ def solve_query(ipq, filename="", verbose=True, options=None, propertyFilename="
             print("unsat")
         else:
             print("sat")
-            for i in range(ipq.getNumInputVariables()):
-                print("input {} = {}".format(i, vals[ipq.inputVariableByIndex(i)]))
-            for i in range(ipq.getNumOutputVariables()):
-                print("output {} = {}".format(i, vals[ipq.outputVariableByIndex(i)]))
+            # Fetch the input/output variables in one call each and print them with a single write
+            lines = ["input {} = {}".format(i, vals[var]) for i, var in enumerate(ipq.getInputVariableIndices())]
+            lines += ["output {} = {}".format(i, vals[var]) for i, var in enumerate(ipq.getOutputVariableIndices())]
+            if lines:
+                print("\n".join(lines))
+
+    return SolveResult(exitCode, vals, stats)
+
+def solve_queries(ipqs, options=None, numJobs=None):
+    """Solve several independent queries concurrently, each in its own thread
+
+    MarabouCore.solve releases the GIL, so up to numJobs queries are solved in parallel.
+    Each thread of the pool takes the next unsolved query until none are left.
+    All queries are solved with the same options, since Marabou's options are global.
+
+    Args:
+        ipqs (list of :class:`~maraboupy.MarabouCore.InputQuery`): InputQuery objects to solve
+        options: (:class:`~maraboupy.MarabouCore.Options`): Object for specifying Marabou options
+        numJobs (int, optional): Number of queries to solve at the same time, defaults to the number of CPUs
 
-    return [exitCode, vals, stats]
+    Returns:
+        (list of :class:`~maraboupy.Marabou.SolveResult`): For each query, in the order given, the result
+        of :func:`~maraboupy.Marabou.solve_query`
+    """
+    if options is None:
+        options = _defaultOptions()
+    if numJobs is None:
+        numJobs = os.cpu_count() or 1
+
+    ipqs = list(ipqs)
+    numThreads = max(1, min(numJobs, len(ipqs)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=numThreads) as executor:
+        return list(executor.map(lambda ipq: SolveResult(*MarabouCore.solve(ipq, options)), ipqs))
+
+class IncrementalSolver:
+    """Solve one query repeatedly under different bounds, preprocessing it only once
+
+    Useful for sweeps where the same query is checked over many input regions: the query is
+    preprocessed when the solver is created, and each call to :meth:`solve` starts from the
+    preprocessed query with the given bounds tightened.
+
+    Args:
+        ipq (:class:`~maraboupy.MarabouCore.InputQuery`): InputQuery object to solve
+        options: (:class:`~maraboupy.MarabouCore.Options`): Object for specifying Marabou options.
+                 Divide-and-conquer options are ignored
+    """
+    def __init__(self, ipq, options=None):
+        if options is None:
+            options = _defaultOptions()
+        self.engine = MarabouCore.Engine(options)
+        self.engine.loadQuery(ipq)
+
+    def solve(self, bounds=None):
+        """Solve the query with some of its bounds tightened
+
+        The bounds only apply to this call; bounds looser than those of the query have no effect.
+
+        Args:
+            bounds (Dict[int, tuple of float], optional): Map from variable to its (lower, upper) bounds.
+                   Use an infinite value to leave one side unchanged
+
+        Returns:
+            (:class:`~maraboupy.Marabou.SolveResult`): The result, as returned by :func:`~maraboupy.Marabou.solve_query`
+        """
+        if bounds:
+            for var, (lowerBound, upperBound) in bounds.items():
+                self.engine.tightenBound(var, lowerBound, upperBound)
+        return SolveResult(*self.engine.solve())
 
 def createOptions(numWorkers=1, initialTimeout=5, initialSplits=0, onlineSplits=2,
                   timeoutInSeconds=0, timeoutFactor=1.5, verbosity=2, snc=False,
@@ -158,28 +369,30 @@ def createOptions(numWorkers=1, initialTimeout=5, initialSplits=0, onlineSplits=
     Returns:
         :class:`~maraboupy.MarabouCore.Options`
     """
-    options = Options()
-    options._numWorkers = numWorkers
-    options._initialTimeout = initialTimeout
-    options._initialDivides = initialSplits
-    options._onlineDivides = onlineSplits
-    options._timeoutInSeconds = timeoutInSeconds
-    options._timeoutFactor = timeoutFactor
-    options._verbosity = verbosity
-    options._snc = snc
-    options._splittingStrategy = splittingStrategy
-    options._sncSplittingStrategy = sncSplittingStrategy
-    options._restoreTreeStates = restoreTreeStates
-    options._splitThreshold = splitThreshold
-    options._solveWithMILP = solveWithMILP
-    options._preprocessorBoundTolerance = preprocessorBoundTolerance
-    options._dumpBounds = dumpBounds
-    options._tighteningStrategy = tighteningStrategy
-    options._milpTightening = milpTightening
-    options._milpSolverTimeout = milpSolverTimeout
-    options._numSimulations = numSimulations
-    options._numBlasThreads = numBlasThreads
-    options._performLpTighteningAfterSplit = performLpTighteningAfterSplit
-    options._lpSolver = lpSolver
-    options._produceProofs = produceProofs
-    return options
+    # Return a copy, so that callers can modify their options without affecting the cached ones
+    return Options(_createOptionsCached(numWorkers, initialTimeout, initialSplits, onlineSplits,
+                                        timeoutInSeconds, timeoutFactor, verbosity, snc,
+                                        splittingStrategy, sncSplittingStrategy, restoreTreeStates,
+                                        splitThreshold, solveWithMILP, preprocessorBoundTolerance,
+                                        dumpBounds, tighteningStrategy, milpTightening,
+                                        milpSolverTimeout, numSimulations, numBlasThreads,
+                                        performLpTighteningAfterSplit, lpSolver, produceProofs))
+
+@functools.lru_cache(maxsize=32, typed=True)
+def _createOptionsCached(*args):
+    """Construct an options object for the given arguments of createOptions, reusing it for repeated arguments
+
+    :meta private:
+    """
+    return Options(*args)
+
+@functools.lru_cache(maxsize=None)
+def _defaultOptions():
+    """Default options used when no options are passed to the solve functions
+
+    The returned object is shared between calls and is only read by the solver, so it must not be
+    modified; callers that need different options pass their own from :func:`createOptions`.
+
+    :meta private:
+    """
+    return createOptions()
@@ -14,12 +14,18 @@
  ** [[ Add lengthier description here ]]
  **/
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <cmath>
+#include <condition_variable>
 #include <map>
+#include <memory>
+#include <mutex>
 #include <vector>
 #include <set>
 #include <string>
+#include <tuple>
 #include <utility>
 #include <sys/stat.h>
 #include <sys/types.h>
@@ -31,6 +37,7 @@
 #include "DnCManager.h"
 #include "DisjunctionConstraint.h"
 #include "Engine.h"
+#include "EngineState.h"
 #include "FloatUtils.h"
 #include "InputQuery.h"
 #include "LeakyReluConstraint.h"
@@ -39,6 +46,7 @@
 #include "MString.h"
 #include "MaxConstraint.h"
 #include "Options.h"
+#include "PiecewiseLinearCaseSplit.h"
 #include "PiecewiseLinearConstraint.h"
 #include "PropertyParser.h"
 #include "VnnLibParser.h"
@@ -167,21 +175,44 @@ void addAbsConstraint(InputQuery& ipq, unsigned b, unsigned f){
     ipq.addPiecewiseLinearConstraint(new AbsoluteValueConstraint(b, f));
 }
 
-void loadProperty(InputQuery &inputQuery, std::string propertyFilePath)
+struct MarabouProperty {
+    // A property file that has been read (and, for vnnlib, tokenized), so
+    // that it can be applied to several input queries
+    String _path;
+    bool _isVnnLib;
+    Vector<String> _vnnlibTokens;
+    List<String> _propertyLines;
+};
+
+MarabouProperty parseProperty(std::string propertyFilePath)
 {
-    String propertyFilePathM = String(propertyFilePath);
-    if ( propertyFilePath != "" )
+    MarabouProperty property;
+    property._path = String(propertyFilePath);
+    property._isVnnLib = property._path.endsWith( ".vnnlib" );
+    if ( property._isVnnLib )
+        property._vnnlibTokens = VnnLibParser::tokenize( property._path );
+    else
+        property._propertyLines = PropertyParser::readLines( property._path );
+    return property;
+}
+
+void applyProperty(InputQuery &inputQuery, const MarabouProperty &property)
+{
+    printf( "Property: %s\n", property._path.ascii() );
+    if ( property._isVnnLib )
     {
-        printf( "Property: %s\n", propertyFilePathM.ascii() );
-        if ( propertyFilePathM.endsWith( ".vnnlib" ) )
-        {
-            VnnLibParser().parse( propertyFilePathM, inputQuery );
-        }
-        else
-        {
-            PropertyParser().parse( propertyFilePathM, inputQuery );
-        }
+        VnnLibParser().parseTokens( property._vnnlibTokens, inputQuery );
+    }
+    else
+    {
+        PropertyParser().parseLines( property._propertyLines, inputQuery );
     }
+}
+
+void loadProperty(InputQuery &inputQuery, std::string propertyFilePath)
+{
+    if ( propertyFilePath != "" )
+        applyProperty( inputQuery, parseProperty( propertyFilePath ) );
     else
         printf( "Property: None\n" );
 }
@@ -214,6 +245,26 @@ bool createInputQuery(InputQuery &inputQuery, std::string networkFilePath, std::
   return true;
 }
 
+std::vector<unsigned> getInputVariableIndices(InputQuery& ipq){
+    // Variables of the inputs, ordered by input index
+    std::vector<unsigned> variables;
+    unsigned numInputVariables = ipq.getNumInputVariables();
+    variables.reserve(numInputVariables);
+    for (unsigned i = 0; i < numInputVariables; ++i)
+        variables.push_back(ipq.inputVariableByIndex(i));
+    return variables;
+}
+
+std::vector<unsigned> getOutputVariableIndices(InputQuery& ipq){
+    // Variables of the outputs, ordered by output index
+    std::vector<unsigned> variables;
+    unsigned numOutputVariables = ipq.getNumOutputVariables();
+    variables.reserve(numOutputVariables);
+    for (unsigned i = 0; i < numOutputVariables; ++i)
+        variables.push_back(ipq.outputVariableByIndex(i));
+    return variables;
+}
+
 void addDisjunctionConstraint(InputQuery& ipq, const std::list<std::list<Equation>>
                               &disjuncts ){
     List<PiecewiseLinearCaseSplit> disjunctList;
@@ -281,6 +332,43 @@ struct MarabouOptions {
         , _produceProofs( Options::get()->getBool( Options::PRODUCE_PROOFS ) )
     {};
 
+    // Set every field in a single call, in the order of the arguments of
+    // Marabou.createOptions
+    MarabouOptions( unsigned numWorkers, unsigned initialTimeout, unsigned initialDivides,
+                    unsigned onlineDivides, unsigned timeoutInSeconds, float timeoutFactor,
+                    unsigned verbosity, bool snc, std::string splittingStrategy,
+                    std::string sncSplittingStrategy, bool restoreTreeStates,
+                    unsigned splitThreshold, bool solveWithMILP,
+                    float preprocessorBoundTolerance, bool dumpBounds,
+                    std::string tighteningStrategy, std::string milpTightening,
+                    float milpSolverTimeout, unsigned numSimulations, unsigned numBlasThreads,
+                    bool performLpTighteningAfterSplit, std::string lpSolver,
+                    bool produceProofs )
+        : _snc( snc )
+        , _restoreTreeStates( restoreTreeStates )
+        , _solveWithMILP( solveWithMILP )
+        , _dumpBounds( dumpBounds )
+        , _performLpTighteningAfterSplit( performLpTighteningAfterSplit )
+        , _produceProofs( produceProofs )
+        , _numWorkers( numWorkers )
+        , _numBlasThreads( numBlasThreads )
+        , _initialTimeout( initialTimeout )
+        , _initialDivides( initialDivides )
+        , _onlineDivides( onlineDivides )
+        , _verbosity( verbosity )
+        , _timeoutInSeconds( timeoutInSeconds )
+        , _splitThreshold( splitThreshold )
+        , _numSimulations( numSimulations )
+        , _timeoutFactor( timeoutFactor )
+        , _preprocessorBoundTolerance( preprocessorBoundTolerance )
+        , _milpSolverTimeout( milpSolverTimeout )
+        , _splittingStrategyString( splittingStrategy )
+        , _sncSplittingStrategyString( sncSplittingStrategy )
+        , _tighteningStrategyString( tighteningStrategy )
+        , _milpTighteningString( milpTightening )
+        , _lpSolverString( lpSolver )
+    {};
+
   void setOptions()
   {
     // Bool options
@@ -314,6 +402,31 @@ struct MarabouOptions {
     Options::get()->setString( Options::LP_SOLVER, _lpSolverString );
   }
 
+  bool operator==( const MarabouOptions &other ) const
+  {
+    return std::tie( _snc, _restoreTreeStates, _solveWithMILP, _dumpBounds,
+                     _performLpTighteningAfterSplit, _produceProofs,
+                     _numWorkers, _numBlasThreads, _initialTimeout,
+                     _initialDivides, _onlineDivides, _verbosity,
+                     _timeoutInSeconds, _splitThreshold, _numSimulations,
+                     _timeoutFactor, _preprocessorBoundTolerance,
+                     _milpSolverTimeout, _splittingStrategyString,
+                     _sncSplittingStrategyString, _tighteningStrategyString,
+                     _milpTighteningString, _lpSolverString ) ==
+           std::tie( other._snc, other._restoreTreeStates, other._solveWithMILP,
+                     other._dumpBounds, other._performLpTighteningAfterSplit,
+                     other._produceProofs, other._numWorkers,
+                     other._numBlasThreads, other._initialTimeout,
+                     other._initialDivides, other._onlineDivides,
+                     other._verbosity, other._timeoutInSeconds,
+                     other._splitThreshold, other._numSimulations,
+                     other._timeoutFactor, other._preprocessorBoundTolerance,
+                     other._milpSolverTimeout, other._splittingStrategyString,
+                     other._sncSplittingStrategyString,
+                     other._tighteningStrategyString,
+                     other._milpTighteningString, other._lpSolverString );
+  }
+
     bool _snc;
     bool _restoreTreeStates;
     bool _solveWithMILP;
@@ -340,6 +453,68 @@ struct MarabouOptions {
 };
 
 
+// Marabou's options are global, and a solve keeps reading them until it
+// finishes. Solves run without the GIL, so solves running at the same time
+// must use the same options: OptionsGuard sets the options for the duration
+// of a solve, first waiting for the solves in flight if they use different
+// options. While such a solve waits, no new solves are admitted, so that it
+// runs as soon as the solves in flight finish.
+std::mutex setOptionsMutex;
+std::condition_variable optionsReleased;
+unsigned solvesInFlight = 0;
+unsigned solvesWaiting = 0;
+std::unique_ptr<MarabouOptions> optionsInFlight;
+
+class OptionsGuard {
+public:
+    OptionsGuard(MarabouOptions &options)
+    {
+        // Wait without the GIL, which the solves in flight need to return.
+        // The lock is declared last, so it is released before the GIL is reacquired
+        std::unique_ptr<py::gil_scoped_release> release;
+        if ( PyGILState_Check() )
+            release.reset( new py::gil_scoped_release() );
+
+        std::unique_lock<std::mutex> lock( setOptionsMutex );
+        bool waiting = false;
+        while ( true )
+        {
+            // Solves waiting for different options go first once the solves
+            // in flight finish; others join the solves in flight only if
+            // nobody is waiting
+            bool admitted = waiting ? solvesInFlight == 0
+                                    : solvesWaiting == 0 &&
+                                          ( solvesInFlight == 0 || *optionsInFlight == options );
+            if ( admitted )
+                break;
+            if ( !waiting && solvesInFlight > 0 && !( *optionsInFlight == options ) )
+            {
+                waiting = true;
+                ++solvesWaiting;
+            }
+            optionsReleased.wait( lock );
+        }
+        if ( waiting && --solvesWaiting == 0 )
+            optionsReleased.notify_all();
+        if ( solvesInFlight == 0 )
+        {
+            options.setOptions();
+            optionsInFlight.reset( new MarabouOptions( options ) );
+        }
+        ++solvesInFlight;
+    }
+
+    ~OptionsGuard()
+    {
+        std::lock_guard<std::mutex> lock( setOptionsMutex );
+        if ( --solvesInFlight == 0 )
+            optionsReleased.notify_all();
+    }
+
+    OptionsGuard(const OptionsGuard &) = delete;
+    OptionsGuard &operator=(const OptionsGuard &) = delete;
+};
+
 /* The default parameters here are just for readability, you should specify
  * them to make them work*/
 InputQuery preprocess(
@@ -350,7 +525,7 @@ InputQuery preprocess(
     //            whether to return the fully processed query (symbolic and more), or just the initially processed query
     // Returns: Preprocessed input query
 
-    options.setOptions();
+    OptionsGuard guard( options );
     Engine engine;
     int output=-1;
     if(redirect.length()>0)
@@ -392,22 +567,42 @@ std::string exitCodeToString( IEngine::ExitCode code )
     }
 }
 
-/* The default parameters here are just for readability, you should specify
- * them in the to make them work*/
-std::tuple<std::string, std::map<int, double>, Statistics>
-    solve(InputQuery &inputQuery, MarabouOptions &options,
-          std::string redirect="")
+// A satisfying assignment is returned either as a map from variable to value,
+// or as a vector indexed by variable
+void initializeAssignment(std::map<int, double> &, unsigned)
+{
+}
+
+void initializeAssignment(std::vector<double> &ret, unsigned numberOfVariables)
+{
+    ret.assign( numberOfVariables, NAN );
+}
+
+void storeSolution(std::map<int, double> &ret, const std::map<int, double> &solution)
+{
+    ret = solution;
+}
+
+void storeSolution(std::vector<double> &ret, const std::map<int, double> &solution)
+{
+    for ( const auto &pair : solution )
+        ret[pair.first] = pair.second;
+}
+
+template <typename Assignment>
+std::tuple<std::string, Assignment, Statistics>
+    solveQuery(InputQuery &inputQuery, MarabouOptions &options, std::string redirect)
 {
     // Arguments: InputQuery object, filename to redirect output
-    // Returns: map from variable number to value
+    // Returns: assignment from variable number to value
     std::string resultString = "";
-    std::map<int, double> ret;
+    Assignment ret;
     Statistics retStats;
     int output=-1;
     if(redirect.length()>0)
         output=redirectOutputToFile(redirect);
     try{
-        options.setOptions();
+        OptionsGuard guard( options );
 
         bool dnc = Options::get()->getBool( Options::DNC_MODE );
 
@@ -427,7 +622,10 @@ std::tuple<std::string, std::map<int, double>, Statistics>
             case DnCManager::SAT:
             {
                 retStats = Statistics();
-                dncManager->getSolution( ret, inputQuery );
+                std::map<int, double> solution;
+                dncManager->getSolution( solution, inputQuery );
+                initializeAssignment( ret, inputQuery.getNumberOfVariables() );
+                storeSolution( ret, solution );
                 break;
             }
             case DnCManager::TIMEOUT:
@@ -449,6 +647,7 @@ std::tuple<std::string, std::map<int, double>, Statistics>
             if (engine.getExitCode() == Engine::SAT)
             {
                 engine.extractSolution(inputQuery);
+                initializeAssignment( ret, inputQuery.getNumberOfVariables() );
                 for(unsigned int i=0; i<inputQuery.getNumberOfVariables(); ++i)
                     ret[i] = inputQuery.getSolutionValue(i);
             }
@@ -467,6 +666,32 @@ std::tuple<std::string, std::map<int, double>, Statistics>
     return std::make_tuple(resultString, ret, retStats);
 }
 
+/* The default parameters here are just for readability, you should specify
+ * them in the to make them work*/
+std::tuple<std::string, std::map<int, double>, Statistics>
+    solve(InputQuery &inputQuery, MarabouOptions &options,
+          std::string redirect="")
+{
+    return solveQuery<std::map<int, double>>( inputQuery, options, redirect );
+}
+
+std::tuple<std::string, py::array_t<double>, Statistics>
+    solveArray(InputQuery &inputQuery, MarabouOptions &options,
+               std::string redirect="")
+{
+    std::tuple<std::string, std::vector<double>, Statistics> result;
+    {
+        py::gil_scoped_release release;
+        result = solveQuery<std::vector<double>>( inputQuery, options, redirect );
+    }
+
+    // Hand the vector's buffer to numpy without copying it
+    auto *values = new std::vector<double>( std::move( std::get<1>( result ) ) );
+    py::capsule owner( values, []( void *v ) { delete static_cast<std::vector<double> *>( v ); } );
+    py::array_t<double> vals( values->size(), values->data(), owner );
+    return std::make_tuple( std::get<0>( result ), vals, std::get<2>( result ) );
+}
+
 std::tuple<std::string, std::map<int, std::tuple<double, double>>, Statistics>
     calculateBounds(InputQuery &inputQuery, MarabouOptions &options,
           std::string redirect="")
@@ -480,7 +705,7 @@ std::tuple<std::string, std::map<int, std::tuple<double, double>>, Statistics>
     if(redirect.length()>0)
         output=redirectOutputToFile(redirect);
     try{
-        options.setOptions();
+        OptionsGuard guard( options );
 
         bool dnc = Options::get()->getBool( Options::DNC_MODE );
 
@@ -510,20 +735,166 @@ std::tuple<std::string, std::map<int, std::tuple<double, double>>, Statistics>
     return std::make_tuple(resultString, ret, retStats);
 }
 
+class MarabouEngine {
+    // Keeps a preprocessed input query in an engine, so that it can be solved
+    // several times under different bounds without preprocessing it again.
+    // Each call to solve starts from the state right after preprocessing, with
+    // the bounds tightened since the previous call.
+public:
+    MarabouEngine(MarabouOptions &options)
+        : _options( options )
+        , _loaded( false )
+        , _feasible( true )
+        , _pendingInfeasible( false )
+    {
+    }
+
+    void loadQuery(InputQuery &inputQuery)
+    {
+        OptionsGuard guard( _options );
+        _loaded = false;
+
+        // Loading again replaces the engine, so the state stored for the
+        // previous one is discarded with it, as DnC workers do
+        _initialState = nullptr;
+        _engine = nullptr;
+
+        _inputQuery = inputQuery;
+        _engine = std::unique_ptr<Engine>( new Engine() );
+        _feasible = _engine->processInputQuery( _inputQuery );
+        if ( _feasible )
+        {
+            _initialState = std::unique_ptr<EngineState>( new EngineState() );
+            _engine->storeState( *_initialState, TableauStateStorageLevel::STORE_ENTIRE_TABLEAU_STATE );
+        }
+        _split = PiecewiseLinearCaseSplit();
+        _pendingInfeasible = false;
+        _loaded = true;
+    }
+
+    void tightenBound(unsigned var, double lowerBound, double upperBound)
+    {
+        if ( !_loaded )
+            throw py::value_error( "loadQuery must be called before tightenBound" );
+        if ( var >= _inputQuery.getNumberOfVariables() )
+            throw py::index_error( "Variable " + std::to_string( var ) + " is not in the query" );
+        if ( !_feasible )
+            return;
+
+        // Bounds are given for the variables of the loaded query; map them to
+        // the variables of the preprocessed query held by the engine
+        if ( _engine->preprocessingEnabled() )
+        {
+            Preprocessor *preprocessor = _engine->getPreprocessor();
+            if ( preprocessor->variableIsUnusedAndSymbolicallyFixed( var ) )
+                throw py::value_error( "Variable " + std::to_string( var ) +
+                                       " was eliminated by the preprocessor" );
+            while ( preprocessor->variableIsMerged( var ) )
+                var = preprocessor->getMergedIndex( var );
+            if ( preprocessor->variableIsFixed( var ) )
+            {
+                double value = preprocessor->getFixedValue( var );
+                if ( FloatUtils::lt( value, lowerBound ) || FloatUtils::gt( value, upperBound ) )
+                    _pendingInfeasible = true;
+                return;
+            }
+            var = preprocessor->getNewIndex( var );
+        }
+
+        if ( FloatUtils::isFinite( lowerBound ) )
+            _split.storeBoundTightening( Tightening( var, lowerBound, Tightening::LB ) );
+        if ( FloatUtils::isFinite( upperBound ) )
+            _split.storeBoundTightening( Tightening( var, upperBound, Tightening::UB ) );
+    }
+
+    std::tuple<std::string, std::map<int, double>, Statistics> solve()
+    {
+        if ( !_loaded )
+            throw py::value_error( "loadQuery must be called before solve" );
+
+        std::map<int, double> ret;
+        PiecewiseLinearCaseSplit split = _split;
+        bool infeasible = !_feasible || _pendingInfeasible;
+        _split = PiecewiseLinearCaseSplit();
+        _pendingInfeasible = false;
+        if ( infeasible )
+            return std::make_tuple( exitCodeToString( IEngine::UNSAT ), ret, Statistics() );
+
+        try {
+            OptionsGuard guard( _options );
+
+            // Same sequence as the DnC workers use to solve a sub-query
+            _engine->restoreState( *_initialState );
+            _engine->reset();
+            _engine->applySnCSplit( split, "" );
+            _engine->solve( Options::get()->getInt( Options::TIMEOUT ) );
+
+            if ( _engine->getExitCode() == Engine::SAT )
+            {
+                _engine->extractSolution( _inputQuery );
+                for ( unsigned int i = 0; i < _inputQuery.getNumberOfVariables(); ++i )
+                    ret[i] = _inputQuery.getSolutionValue( i );
+            }
+            return std::make_tuple( exitCodeToString( _engine->getExitCode() ), ret,
+                                    *( _engine->getStatistics() ) );
+        }
+        catch(const MarabouError &e){
+            fprintf( stderr, "Caught a MarabouError. Code: %u. Message: %s\n", e.getCode(), e.getUserMessage() );
+            return std::make_tuple( "ERROR", ret, Statistics() );
+        }
+    }
+
+private:
+    MarabouOptions _options;
+    InputQuery _inputQuery;
+    std::unique_ptr<Engine> _engine;
+    std::unique_ptr<EngineState> _initialState;
+    PiecewiseLinearCaseSplit _split;
+    bool _loaded;
+    bool _feasible;
+    bool _pendingInfeasible;
+};
+
 void saveQuery(InputQuery& inputQuery, std::string filename){
     inputQuery.saveQuery(String(filename));
 }
 
+// Building an InputQuery reads the global options, so loading a query must
+// not overlap with OptionsGuard setting them for a solve in another thread
 InputQuery loadQuery(std::string filename){
+    std::lock_guard<std::mutex> lock( setOptionsMutex );
     return QueryLoader::loadQuery(String(filename));
 }
 
+InputQuery loadQueryFromBuffer(py::buffer buffer){
+    // The buffer is requested while holding the GIL; parsing does not need it
+    py::buffer_info info = buffer.request();
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock( setOptionsMutex );
+    return QueryLoader::loadQueryFromBuffer(static_cast<const char *>(info.ptr),
+                                            static_cast<size_t>(info.size) * info.itemsize);
+}
+
 // Code necessary to generate Python library
 // Describes which classes and functions are exposed to API
 PYBIND11_MODULE(MarabouCore, m) {
     m.doc() = "Maraboupy bindings to the C++ Marabou via pybind11";
     py::class_<MarabouOptions>(m, "Options")
         .def(py::init())
+        .def(py::init<const MarabouOptions &>(), py::arg("other"))
+        .def(py::init<unsigned, unsigned, unsigned, unsigned, unsigned, float, unsigned, bool,
+                      std::string, std::string, bool, unsigned, bool, float, bool, std::string,
+                      std::string, float, unsigned, unsigned, bool, std::string, bool>(),
+             py::arg("numWorkers"), py::arg("initialTimeout"), py::arg("initialSplits"),
+             py::arg("onlineSplits"), py::arg("timeoutInSeconds"), py::arg("timeoutFactor"),
+             py::arg("verbosity"), py::arg("snc"), py::arg("splittingStrategy"),
+             py::arg("sncSplittingStrategy"), py::arg("restoreTreeStates"),
+             py::arg("splitThreshold"), py::arg("solveWithMILP"),
+             py::arg("preprocessorBoundTolerance"), py::arg("dumpBounds"),
+             py::arg("tighteningStrategy"), py::arg("milpTightening"),
+             py::arg("milpSolverTimeout"), py::arg("numSimulations"), py::arg("numBlasThreads"),
+             py::arg("performLpTighteningAfterSplit"), py::arg("lpSolver"),
+             py::arg("produceProofs"))
         .def_readwrite("_numWorkers", &MarabouOptions::_numWorkers)
         .def_readwrite("_numBlasThreads", &MarabouOptions::_numBlasThreads)
         .def_readwrite("_initialTimeout", &MarabouOptions::_initialTimeout)
@@ -549,6 +920,25 @@ PYBIND11_MODULE(MarabouCore, m) {
         .def_readwrite("_produceProofs", &MarabouOptions::_produceProofs);
     m.def("maraboupyMain", &maraboupyMain, "Run the Marabou command-line interface");
     m.def("loadProperty", &loadProperty, "Load a property file into a input query");
+    py::class_<MarabouProperty>(m, "Property");
+    m.def("parseProperty", &parseProperty, R"pbdoc(
+        Read a property file, so that it can be applied to several input queries without reading it again
+
+        Args:
+            propertyFilePath (str): Path to the property file (.vnnlib, or Marabou's text format)
+
+        Returns:
+            :class:`~maraboupy.MarabouCore.Property`
+        )pbdoc",
+        py::arg("propertyFilePath"));
+    m.def("applyProperty", &applyProperty, R"pbdoc(
+        Add the constraints of a property read by :func:`~maraboupy.MarabouCore.parseProperty` to an input query
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to add the property to
+            property (:class:`~maraboupy.MarabouCore.Property`): Property to add
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("property"));
     m.def("createInputQuery", &createInputQuery, "Create input query from network and property file");
     m.def("preprocess", &preprocess, R"pbdoc(
          Takes a reference to an InputQuery and preproccesses it with Marabou preprocessor.
@@ -577,7 +967,59 @@ PYBIND11_MODULE(MarabouCore, m) {
                 - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise a dictionary of SATisfying values for variables
                 - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
         )pbdoc",
+        py::arg("inputQuery"), py::arg("options"), py::arg("redirect") = "",
+        py::call_guard<py::gil_scoped_release>());
+    m.def("solveArray", &solveArray, R"pbdoc(
+        Takes in a description of the InputQuery and returns the solution as a numpy array
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            options (class:`~maraboupy.MarabouCore.Options`): Object defining the options used for Marabou
+            redirect (str, optional): Filepath to direct standard output, defaults to ""
+
+        Returns:
+            (tuple): tuple containing:
+                - exitCode (str): A string representing the exit code (sat/unsat/TIMEOUT/ERROR/UNKNOWN/QUIT_REQUESTED).
+                - vals (numpy array of float): Empty array if UNSAT, otherwise an array whose element i is the SATisfying value of variable i (NaN if no value was found for it)
+                - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
+        )pbdoc",
         py::arg("inputQuery"), py::arg("options"), py::arg("redirect") = "");
+    py::class_<MarabouEngine>(m, "Engine", R"pbdoc(
+        Engine that keeps a preprocessed input query, so that it can be solved several times
+        under different bounds without preprocessing it again. Divide-and-conquer options are ignored.
+
+        Args:
+            options (class:`~maraboupy.MarabouCore.Options`): Object defining the options used for Marabou
+        )pbdoc")
+        .def(py::init<MarabouOptions &>(), py::arg("options"))
+        .def("loadQuery", &MarabouEngine::loadQuery, R"pbdoc(
+            Preprocess an input query and keep it in the engine, replacing any query loaded before
+
+            Args:
+                inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            )pbdoc",
+            py::arg("inputQuery"), py::call_guard<py::gil_scoped_release>())
+        .def("tightenBound", &MarabouEngine::tightenBound, R"pbdoc(
+            Tighten the bounds of a variable of the loaded query for the next call to solve only.
+            Bounds looser than those of the loaded query have no effect; use an infinite value to
+            leave one side unchanged.
+
+            Args:
+                var (int): Variable of the loaded query
+                lowerBound (float): Lower bound
+                upperBound (float): Upper bound
+            )pbdoc",
+            py::arg("var"), py::arg("lowerBound"), py::arg("upperBound"))
+        .def("solve", &MarabouEngine::solve, R"pbdoc(
+            Solve the loaded query under the bounds tightened since the previous call
+
+            Returns:
+                (tuple): tuple containing:
+                    - exitCode (str): A string representing the exit code (sat/unsat/TIMEOUT/ERROR/UNKNOWN/QUIT_REQUESTED).
+                    - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise a dictionary of SATisfying values for variables
+                    - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
+            )pbdoc",
+            py::call_guard<py::gil_scoped_release>());
     m.def("calculateBounds", &calculateBounds, R"pbdoc(
         Takes in a description of the InputQuery and returns the bounds
 
@@ -610,7 +1052,18 @@ PYBIND11_MODULE(MarabouCore, m) {
         Returns:
             :class:`~maraboupy.MarabouCore.InputQuery`
         )pbdoc",
-        py::arg("filename"));
+        py::arg("filename"), py::call_guard<py::gil_scoped_release>());
+    m.def("loadQueryFromBuffer", &loadQueryFromBuffer, R"pbdoc(
+        Loads and returns a serialized InputQuery from a buffer holding the contents of a query file.
+        The buffer is read in place, so a memory-mapped file can be loaded without copying it to the heap
+
+        Args:
+            buffer (buffer): Object supporting the buffer protocol (e.g., bytes or mmap.mmap)
+
+        Returns:
+            :class:`~maraboupy.MarabouCore.InputQuery`
+        )pbdoc",
+        py::arg("buffer"));
     m.def("addClipConstraint", &addClipConstraint, R"pbdoc(
         Add a Clip constraint to the InputQuery
 
@@ -727,7 +1180,11 @@ PYBIND11_MODULE(MarabouCore, m) {
         .def("inputVariableByIndex", &InputQuery::inputVariableByIndex)
         .def("markInputVariable", &InputQuery::markInputVariable)
         .def("markOutputVariable", &InputQuery::markOutputVariable)
-        .def("outputVariableByIndex", &InputQuery::outputVariableByIndex);
+        .def("outputVariableByIndex", &InputQuery::outputVariableByIndex)
+        .def("getInputVariableIndices", &getInputVariableIndices,
+             "Return the input variables as a list, where element i is the variable of input i")
+        .def("getOutputVariableIndices", &getOutputVariableIndices,
+             "Return the output variables as a list, where element i is the variable of output i");
     py::enum_<PiecewiseLinearFunctionType>(m, "PiecewiseLinearFunctionType")
         .value("ReLU", PiecewiseLinearFunctionType::RELU)
         .value("AbsoluteValue", PiecewiseLinearFunctionType::ABSOLUTE_VALUE)
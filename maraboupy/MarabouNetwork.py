@@ -76,13 +76,13 @@ class MarabouNetwork(InputQueryBuilder):
         if verbose:
             print(exitCode)
             if exitCode == "sat":
-                for j in range(len(self.inputVars)):
-                    for i in range(self.inputVars[j].size):
-                        print("input {} = {}".format(i, vals[self.inputVars[j].item(i)]))
-
-                for j in range(len(self.outputVars)):
-                    for i in range(self.outputVars[j].size):
-                        print("output {} = {}".format(i, vals[self.outputVars[j].item(i)]))
+                # Convert each variable array to a list once and print all values with a single write
+                lines = ["input {} = {}".format(i, vals[var])
+                         for inputVars in self.inputVars for i, var in enumerate(inputVars.ravel().tolist())]
+                lines += ["output {} = {}".format(i, vals[var])
+                          for outputVars in self.outputVars for i, var in enumerate(outputVars.ravel().tolist())]
+                if lines:
+                    print("\n".join(lines))
 
         return [exitCode, vals, stats]
 
@@ -109,9 +109,10 @@ class MarabouNetwork(InputQueryBuilder):
         if verbose:
             print(exitCode)
             if exitCode == "":
-                for j in range(len(self.outputVars)):
-                    for i in range(self.outputVars[j].size):
-                        print("output bounds {} = {}".format(i, bounds[self.outputVars[j].item(i)]))
+                lines = ["output bounds {} = {}".format(i, bounds[var])
+                         for outputVars in self.outputVars for i, var in enumerate(outputVars.ravel().tolist())]
+                if lines:
+                    print("\n".join(lines))
 
         return [exitCode, bounds, stats]
 
@@ -195,13 +196,12 @@ class MarabouNetwork(InputQueryBuilder):
                 print("TO")
             elif len(vals) > 0:
                 print("sat")
-                for j in range(len(self.inputVars[0])):
-                    for i in range(self.inputVars[0][j].size):
-                        print("input {} = {}".format(i, vals[self.inputVars[0][j].item(i)]))
-
-                for j in range(len(self.outputVars[0])):
-                    for i in range(self.outputVars[0][j].size):
-                        print("output {} = {}".format(i, vals[self.outputVars[0][j].item(i)]))
+                lines = ["input {} = {}".format(i, vals[var])
+                         for inputVars in self.inputVars[0] for i, var in enumerate(inputVars.ravel().tolist())]
+                lines += ["output {} = {}".format(i, vals[var])
+                          for outputVars in self.outputVars[0] for i, var in enumerate(outputVars.ravel().tolist())]
+                if lines:
+                    print("\n".join(lines))
 
         return [vals, stats, maxClass]
 
@@ -240,21 +240,11 @@ class MarabouNetworkNNet(MarabouNetwork.MarabouNetwork):
 
                 previousLayerSize = layerSizes[layernum]
                 currentLayerSize = layerSizes[layernum + 1]
-                # weights
-                weights.append([])
-                biases.append([])
-                # weights
-                for i in range(currentLayerSize):
-                    line = f.readline()
-                    aux = [float(x) for x in line.strip().split(",")[:-1]]
-                    weights[layernum].append([])
-                    for j in range(previousLayerSize):
-                        weights[layernum][i].append(aux[j])
+                # weights, keeping only the first previousLayerSize values of each row
+                weights.append([list(map(float, f.readline().split(",")[:previousLayerSize]))
+                                for _ in range(currentLayerSize)])
                 # biases
-                for i in range(currentLayerSize):
-                    line = f.readline()
-                    x = float(line.strip().split(",")[0])
-                    biases[layernum].append(x)
+                biases.append([float(f.readline().split(",")[0]) for _ in range(currentLayerSize)])
 
             self.numLayers = numLayers
             self.layerSizes = layerSizes
@@ -15,10 +15,49 @@ directory for licensing information.
 MarabouNetworkONNX represents neural networks with piecewise linear constraints derived from the ONNX format
 '''
 import onnx
+import onnx.utils
 import onnxruntime
 from maraboupy.MarabouNetwork import MarabouNetwork
 from maraboupy.parsers.ONNXParser import ONNXParser
+import hashlib
 import os
+import tempfile
+
+def _extractedModelPath(filename, inputNames, outputNames):
+    """Return the path of a cached ONNX model containing only the part of the given model between
+    inputNames and outputNames, extracting it with onnx.utils.extract_model if it is not cached yet
+
+    The cache is stored in $XDG_CACHE_HOME/maraboupy/extracted (~/.cache/maraboupy/extracted by default),
+    and an entry is reused only while the original file's path, size, and modification time are unchanged.
+
+    Args:
+        filename (str): Path to the ONNX file
+        inputNames (list of str): List of node names corresponding to inputs
+        outputNames (list of str): List of node names corresponding to outputs
+
+    Returns:
+        (str): Path to the extracted ONNX model
+
+    :meta private:
+    """
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    key = repr((filename, stat.st_size, stat.st_mtime_ns, list(inputNames), list(outputNames)))
+    cacheDir = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+                            "maraboupy", "extracted")
+    cachedFilename = os.path.join(cacheDir, hashlib.sha1(key.encode()).hexdigest() + ".onnx")
+    if not os.path.isfile(cachedFilename):
+        os.makedirs(cacheDir, exist_ok=True)
+        # Extract to a temporary file first, so that an interrupted extraction is never cached
+        fd, tmpFilename = tempfile.mkstemp(suffix=".onnx", dir=cacheDir)
+        os.close(fd)
+        try:
+            onnx.utils.extract_model(filename, tmpFilename, list(inputNames), list(outputNames))
+            os.replace(tmpFilename, cachedFilename)
+        finally:
+            if os.path.isfile(tmpFilename):
+                os.remove(tmpFilename)
+    return cachedFilename
 
 class MarabouNetworkONNX(MarabouNetwork):
     """Constructs a MarabouNetworkONNX object from an ONNX file
@@ -27,20 +66,29 @@ class MarabouNetworkONNX(MarabouNetwork):
         filename (str): Path to the ONNX file
         inputNames: (list of str, optional): List of node names corresponding to inputs
         outputNames: (list of str, optional): List of node names corresponding to outputs
+        lazy (bool, optional): If true, initializers stored as external data are only read from disk
+            when a node between the inputs and outputs uses them, defaults to True
+        cacheExtracted (bool, optional): If true and both inputNames and outputNames are given, parse the
+            part of the network between them from a cached extracted model, so that later reads of the same
+            slice skip loading the full model, defaults to False
 
     Returns:
         :class:`~maraboupy.Marabou.marabouNetworkONNX.marabouNetworkONNX`
     """
-    def __init__(self, filename, inputNames=None, outputNames=None):
+    def __init__(self, filename, inputNames=None, outputNames=None, lazy=True, cacheExtracted=False):
         super().__init__()
-        self.readONNX(filename, inputNames, outputNames)
+        if cacheExtracted and inputNames is not None and outputNames is not None:
+            if isinstance(outputNames, str):
+                outputNames = [outputNames]
+            filename = _extractedModelPath(filename, inputNames, outputNames)
+        self.readONNX(filename, inputNames, outputNames, lazy=lazy)
 
-    def readONNX(self, filename, inputNames=None, outputNames=None, preserveExistingConstraints=False):
+    def readONNX(self, filename, inputNames=None, outputNames=None, preserveExistingConstraints=False, lazy=True):
         if not preserveExistingConstraints:
             self.clear()
 
         self.filename = filename
-        self.graph = onnx.load(filename).graph
+        self.graph = onnx.load(filename, load_external_data=not lazy).graph
 
         # Setup input node names
         if inputNames is not None:
@@ -71,7 +119,7 @@ class MarabouNetworkONNX(MarabouNetwork):
             initNames = [node.name for node in self.graph.initializer]
             self.outputNames = [out.name for out in self.graph.output if out.name not in initNames]
 
-        ONNXParser.parse(self, self.graph, self.inputNames, self.outputNames)
+        ONNXParser.parse(self, self.graph, self.inputNames, self.outputNames, os.path.dirname(filename))
 
     def getNode(self, nodeName):
         """Find the node in the graph corresponding to the given name
@@ -32,7 +32,7 @@ class ONNXParser:
     """
 
     @staticmethod
-    def parse(query:InputQueryBuilder, graph, inputNames:List[str], outputNames:List[str]):
+    def parse(query:InputQueryBuilder, graph, inputNames:List[str], outputNames:List[str], baseDir:str=""):
         """
         Parses the provided ONNX graph into constraints which are stored in the query argument.
 
@@ -41,15 +41,17 @@ class ONNXParser:
             graph: the graph of the ONNX file to parse.
             inputNames: list of node names corresponding to inputs
             outputNames: list of node names corresponding to outputs
+            baseDir: directory containing the ONNX file, used to read initializers whose
+                data is stored externally and was not loaded with the graph
 
         Returns:
             :class:`~maraboupy.Marabou.marabouNetworkONNX.marabouNetworkONNX`
         """
-        parser = ONNXParser(query, graph, inputNames, outputNames)
+        parser = ONNXParser(query, graph, inputNames, outputNames, baseDir)
         parser.parseGraph()
 
 
-    def __init__(self, query:InputQueryBuilder, graph, inputNames, outputNames):
+    def __init__(self, query:InputQueryBuilder, graph, inputNames, outputNames, baseDir=""):
         """
         Should not be called directly. Use `ONNXParser.parse` instead.
 
@@ -60,6 +62,10 @@ class ONNXParser:
         self.graph = graph
         self.inputNames = inputNames
         self.outputNames = outputNames
+        self.baseDir = baseDir
+
+        # Initializers are only converted to numpy arrays when a node reached from the outputs uses them
+        self.initializerMap = {init.name: init for init in graph.initializer}
 
         self.madeGraphEquations = []
         self.varMap = dict()
@@ -260,8 +266,8 @@ class ONNXParser:
         for inp in node.input:
             if len([nde for nde in self.graph.node if inp in nde.output]):
                 inNodes += [inp]
-            elif len([nde for nde in self.graph.initializer if nde.name == inp]):
-                self.constantMap[inp] = [numpy_helper.to_array(init) for init in self.graph.initializer if init.name == inp][0]
+            elif inp in self.initializerMap:
+                self.constantMap[inp] = numpy_helper.to_array(self.initializerMap[inp], self.baseDir)
         return inNodes
 
     def constant(self, node):
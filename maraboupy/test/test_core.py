@@ -21,6 +21,26 @@ def test_main():
     exitCode = MarabouCore.maraboupyMain(["Marabou", "--version"])
     assert exitCode == 0
 
+def test_create_options_copies():
+    """
+    Tests that options returned by createOptions can be modified without affecting
+    later calls with the same arguments.
+    """
+    options1 = createOptions(verbosity=0)
+    options1._timeoutInSeconds = 10
+    options2 = createOptions(verbosity=0)
+    assert options2._verbosity == 0
+    assert options2._timeoutInSeconds == 0
+
+def test_create_options_argument_types():
+    """
+    Tests that an argument of the wrong type is rejected even when an equal argument
+    of the right type has already been cached.
+    """
+    createOptions(timeoutInSeconds=10)
+    with pytest.raises(TypeError):
+        createOptions(timeoutInSeconds=10.0)
+
 def test_solve_round_and_clip_unsat():
     """
     -1 <= x0 <= 2
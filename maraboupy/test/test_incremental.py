@@ -4,6 +4,7 @@ warnings.filterwarnings('ignore', category = DeprecationWarning)
 warnings.filterwarnings('ignore', category = PendingDeprecationWarning)
 
 from maraboupy import Marabou
+from maraboupy import MarabouCore
 import numpy as np
 import os
 
@@ -62,3 +63,59 @@ def test_incremental():
 
     for i in range(len(result_inc)):
         assert(result_noninc[i] == result_inc[i])
+
+def test_incremental_solver():
+    """
+    Test that solving a query repeatedly with an IncrementalSolver gives the same results as solving it from scratch
+    """
+    filename = os.path.join(os.path.dirname(__file__), ONNX_FILE)
+    network = Marabou.read_onnx(filename)
+    inputVars = np.array(network.inputVars[0]).flatten()
+    outputVars = network.outputVars[0].flatten()
+    for i, x in enumerate(inputVars):
+        network.setLowerBound(x, 0)
+        network.setUpperBound(x, 1)
+    for outputIndex in range(len(outputVars)):
+        if outputIndex != LABEL:
+            network.addInequality([outputVars[outputIndex], outputVars[LABEL]], [1, -1], 0)
+
+    solver = Marabou.IncrementalSolver(network.getInputQuery(), options=OPT)
+    random_images = [np.random.random((784,1)) for _ in range(NUM_SAMPLES)]
+    for img in random_images:
+        bounds = {x: (max(0, img[i][0] - EPSILON), min(1, img[i][0] + EPSILON)) for i, x in enumerate(inputVars)}
+        exitCode_inc, vals_inc, _ = solver.solve(bounds)
+
+        ipq = network.getInputQuery()
+        for x, (lowerBound, upperBound) in bounds.items():
+            ipq.setLowerBound(x, lowerBound)
+            ipq.setUpperBound(x, upperBound)
+        exitCode, _, _ = Marabou.solve_query(ipq, options=OPT, verbose=False)
+        assert exitCode_inc == exitCode
+        if exitCode_inc == "sat":
+            for x, (lowerBound, upperBound) in bounds.items():
+                assert lowerBound - 1e-6 <= vals_inc[x] <= upperBound + 1e-6
+
+def test_incremental_solver_reload():
+    """
+    Test that loading another query into an engine replaces the previous one
+    """
+    filename = os.path.join(os.path.dirname(__file__), ONNX_FILE)
+    network = Marabou.read_onnx(filename)
+    outputVars = network.outputVars[0].flatten()
+    for x in np.array(network.inputVars[0]).flatten():
+        network.setLowerBound(x, 0)
+        network.setUpperBound(x, 1)
+    ipq = network.getInputQuery()
+
+    engine = MarabouCore.Engine(OPT)
+    engine.loadQuery(ipq)
+    engine.loadQuery(ipq)
+    exitCode, _, _ = engine.solve()
+    exitCode_ipq, _, _ = Marabou.solve_query(network.getInputQuery(), options=OPT, verbose=False)
+    assert exitCode == exitCode_ipq
+
+    # The bounds tightened for the first query do not carry over to the second
+    engine.tightenBound(int(outputVars[0]), 1e9, float("inf"))
+    engine.loadQuery(ipq)
+    exitCode, _, _ = engine.solve()
+    assert exitCode == exitCode_ipq
@@ -242,6 +242,38 @@ def test_preserve_existing_constraints_clear():
             assert(c1 == c2 and v1 + numVar1 == v2)
         assert(eq1.scalar == eq2.scalar)
 
+def test_external_data(tmpdir):
+    """
+    Test that a network whose initializers are stored as external data produces the same
+    equations whether its initializers are read eagerly or lazily
+    """
+    import onnx
+    filename = os.path.join(os.path.dirname(__file__), NETWORK_FOLDER, "fc1.onnx")
+    externalFilename = tmpdir.join("fc1_external.onnx").strpath
+    onnx.save_model(onnx.load(filename), externalFilename, save_as_external_data=True,
+                    all_tensors_to_one_file=True, location="fc1_external.data", size_threshold=0)
+
+    network_eager = Marabou.read_onnx(externalFilename, lazy = False)
+    network_lazy = Marabou.read_onnx(externalFilename)
+    assert len(network_eager.equList) == len(network_lazy.equList)
+    for eq_eager, eq_lazy in zip(network_eager.equList, network_lazy.equList):
+        assert eq_eager.addendList == eq_lazy.addendList
+        assert eq_eager.scalar == eq_lazy.scalar
+
+def test_cache_extracted(tmpdir, monkeypatch):
+    """
+    Test that a sub-network read through the extracted-model cache matches the sub-network read directly
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", tmpdir.strpath)
+    filename = os.path.join(os.path.dirname(__file__), NETWORK_FOLDER, "conv_mp1.onnx")
+    network = Marabou.read_onnx(filename, inputNames = ['11'], outputNames = ['Y'])
+    for _ in range(2):
+        network_cached = Marabou.read_onnx(filename, inputNames = ['11'], outputNames = ['Y'], cacheExtracted = True)
+        assert network.numVars == network_cached.numVars
+        assert len(network.equList) == len(network_cached.equList)
+        assert len(network.reluList) == len(network_cached.reluList)
+    assert len(os.listdir(os.path.join(tmpdir.strpath, "maraboupy", "extracted"))) == 1
+
 def test_batch_norm():
     """
     Test a network exported from pytorch
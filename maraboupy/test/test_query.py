@@ -7,6 +7,7 @@ import pytest
 from subprocess import call
 from maraboupy import Marabou
 from maraboupy import MarabouCore
+import concurrent.futures
 import numpy as np
 import os
 
@@ -103,6 +104,155 @@ def test_to_query(tmpdir):
     assert stats_ipq.hasTimedOut()
     assert(exitCode_net == "TIMEOUT" and exitCode_ipq == "TIMEOUT")
 
+def test_property_file_cache(tmpdir, monkeypatch):
+    """
+    Test that a property file applied to several queries is read once, and read again after it changes
+    """
+    monkeypatch.chdir(tmpdir)
+    propertyFile = "property.txt"
+    with open(propertyFile, "w") as f:
+        f.write("y0 >= 70\n")
+    opt = Marabou.createOptions(verbosity = 0)
+
+    def solve():
+        return Marabou.solve_query(load_onnx_network().getInputQuery(), verbose = False, options = opt,
+                                   propertyFilename = propertyFile)
+
+    Marabou._parseProperty.cache_clear()
+    for _ in range(2):
+        exitCode, _, _ = solve()
+        assert exitCode == "sat"
+    cacheInfo = Marabou._parseProperty.cache_info()
+    assert cacheInfo.misses == 1 and cacheInfo.hits == 1
+
+    # Rewrite the property within the timestamp granularity: the new size must be picked up
+    stat = os.stat(propertyFile)
+    with open(propertyFile, "w") as f:
+        f.write("y0 >= 2000\n")
+    os.utime(propertyFile, ns = (stat.st_atime_ns, stat.st_mtime_ns))
+    exitCode, vals, _ = solve()
+    assert exitCode == "unsat"
+    assert len(vals) == 0
+    assert Marabou._parseProperty.cache_info().misses == 2
+
+    # Rewrite the property with the same size and a later modification time
+    stat = os.stat(propertyFile)
+    with open(propertyFile, "w") as f:
+        f.write("y0 >= 70.0\n")
+    os.utime(propertyFile, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    exitCode, _, _ = solve()
+    assert exitCode == "sat"
+    assert Marabou._parseProperty.cache_info().misses == 3
+
+def test_solve_queries():
+    """
+    Test that queries solved concurrently return the same results, in order, as queries solved one at a time
+    """
+    ipqs = []
+    for minOutputValue in [70.0, 2000.0, 70.0]:
+        network = load_onnx_network()
+        network.setLowerBound(network.outputVars[0].flatten()[0], minOutputValue)
+        ipqs.append(network.getInputQuery())
+
+    opt = Marabou.createOptions(verbosity = 0)
+    results = Marabou.solve_queries(ipqs, options = opt, numJobs = 2)
+    assert len(results) == len(ipqs)
+    for ipq, (exitCode, vals, _) in zip(ipqs, results):
+        exitCode_ipq, vals_ipq, _ = Marabou.solve_query(ipq, options = opt, verbose = False)
+        assert exitCode == exitCode_ipq
+        assert len(vals) == len(vals_ipq)
+
+def test_solve_threads_different_options():
+    """
+    Test that queries solved from several threads with different options each use their own options
+    """
+    network = load_onnx_network()
+    network.setLowerBound(network.outputVars[0].flatten()[0], 70.0)
+    optionsList = [Marabou.createOptions(verbosity = 0, timeoutInSeconds = 0),
+                   Marabou.createOptions(verbosity = 0, timeoutInSeconds = 0, tighteningStrategy = "none")] * 2
+    ipqs = [network.getInputQuery() for _ in optionsList]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers = len(ipqs)) as executor:
+        futures = [executor.submit(Marabou.solve_query, ipq, verbose = False, options = opt)
+                   for ipq, opt in zip(ipqs, optionsList)]
+        results = [future.result() for future in futures]
+
+    for ipq, opt, (exitCode, vals, _) in zip(ipqs, optionsList, results):
+        assert exitCode == "sat"
+        exitCode_seq, vals_seq, _ = Marabou.solve_query(network.getInputQuery(), options = opt, verbose = False)
+        assert exitCode == exitCode_seq
+        assert len(vals) == len(vals_seq)
+
+def test_vals_as_array():
+    """
+    Test that the satisfying assignment returned as a numpy array matches the one returned as a dictionary
+    """
+    network = load_onnx_network()
+    network.setLowerBound(network.outputVars[0].flatten()[0], 70.0)
+    opt = Marabou.createOptions(verbosity = 0)
+
+    exitCode_dict, vals_dict, _ = Marabou.solve_query(network.getInputQuery(), options = opt, verbose = False)
+    exitCode_arr, vals_arr, _ = Marabou.solve_query(network.getInputQuery(), options = opt, verbose = False,
+                                                    vals_as_array = True)
+    assert exitCode_dict == exitCode_arr == "sat"
+    assert isinstance(vals_arr, np.ndarray)
+    assert len(vals_arr) == len(vals_dict)
+    for var, val in vals_dict.items():
+        assert vals_arr[var] == val
+
+def test_solve_result():
+    """
+    Test that the result of solve_query can be read by attribute as well as unpacked as a tuple
+    """
+    network = load_onnx_network()
+    network.setLowerBound(network.outputVars[0].flatten()[0], 70.0)
+    result = Marabou.solve_query(network.getInputQuery(), options = Marabou.createOptions(verbosity = 0),
+                                 verbose = False)
+    exitCode, vals, stats = result
+    assert result.exitCode == exitCode == "sat"
+    assert result.vals is vals
+    assert result.stats is stats
+
+def test_load_query_mmap(tmpdir):
+    """
+    Test that a query loaded through a memory-mapped buffer is identical to one loaded from the file directly
+    """
+    network = load_acas_network()
+    queryFile = tmpdir.mkdir("query").join("query.txt").strpath
+    network.saveQuery(queryFile)
+
+    ipq_mmap = Marabou.load_query(queryFile)
+    ipq_file = Marabou.load_query(queryFile, mmap = False)
+
+    ipq_mmap_filename = tmpdir.join("query_mmap.txt").strpath
+    ipq_file_filename = tmpdir.join("query_file.txt").strpath
+    MarabouCore.saveQuery(ipq_mmap, ipq_mmap_filename)
+    MarabouCore.saveQuery(ipq_file, ipq_file_filename)
+    diff = call(['diff', ipq_mmap_filename, ipq_file_filename])
+    assert not diff
+
+def test_load_query_direct(tmpdir):
+    """
+    Test that a query loaded with O_DIRECT, or the fallback where it is unsupported, matches the query file
+    """
+    network = load_acas_network()
+    queryFile = tmpdir.mkdir("query").join("query.txt").strpath
+    network.saveQuery(queryFile)
+
+    ipq_direct = Marabou.load_query(queryFile, direct = True)
+    ipq_direct_filename = tmpdir.join("query_direct.txt").strpath
+    MarabouCore.saveQuery(ipq_direct, ipq_direct_filename)
+    diff = call(['diff', queryFile, ipq_direct_filename])
+    assert not diff
+
+def test_variable_indices():
+    """
+    Test that the input and output variables fetched in a single call match the variables fetched by index
+    """
+    ipq = load_acas_network().getInputQuery()
+    assert ipq.getInputVariableIndices() == [ipq.inputVariableByIndex(i) for i in range(ipq.getNumInputVariables())]
+    assert ipq.getOutputVariableIndices() == [ipq.outputVariableByIndex(i) for i in range(ipq.getNumOutputVariables())]
+
 def test_get_marabou_query(tmpdir):
     '''
     Tests that input query generated from a network in Maraboupy is identical to the input query generated directly by
@@ -53,13 +53,19 @@ void matrixMultiplication( const double *matA,
                            unsigned columnsA,
                            unsigned columnsB )
 {
+    // Loop in i-k-j order, so that the innermost loop walks rows of B and C
+    // contiguously instead of striding down a column of B. Each entry of C
+    // still accumulates its products in increasing k, as in the i-j-k order.
     for ( unsigned i = 0; i < rowsA; ++i )
     {
-        for ( unsigned j = 0; j < columnsB; ++j )
+        double *rowC = matC + i * columnsB;
+        for ( unsigned k = 0; k < columnsA; ++k )
         {
-            for ( unsigned k = 0; k < columnsA; ++k )
+            double a = matA[i * columnsA + k];
+            const double *rowB = matB + k * columnsB;
+            for ( unsigned j = 0; j < columnsB; ++j )
             {
-                matC[i * columnsB + j] += matA[i * columnsA + k] * matB[k * columnsB + j];
+                rowC[j] += a * rowB[j];
             }
         }
     }
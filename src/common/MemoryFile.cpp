@@ -0,0 +1,82 @@
+/*********************                                                        */
+/*! \file MemoryFile.cpp
+ ** \verbatim
+ ** This file is part of the Marabou project.
+ ** Copyright (c) 2017-2019 by the authors listed in the file AUTHORS
+ ** in the top-level source directory) and their institutional affiliations.
+ ** All rights reserved. See the file COPYING in the top-level source
+ ** directory for licensing information.\endverbatim
+ **
+ ** \brief Reading lines and chunks out of an in-memory buffer, without copying it
+ **/
+
+#include "MemoryFile.h"
+
+#include "CommonError.h"
+#include "ConstSimpleData.h"
+#include "HeapData.h"
+
+#include <cstring>
+
+MemoryFile::MemoryFile( const char *data, size_t size )
+    : _data( data )
+    , _size( size )
+    , _position( 0 )
+{
+}
+
+void MemoryFile::close()
+{
+}
+
+void MemoryFile::open( Mode openMode )
+{
+    if ( openMode != IFile::MODE_READ )
+        throw CommonError( CommonError::OPEN_FAILED, "MemoryFile can only be opened for reading" );
+
+    _position = 0;
+}
+
+void MemoryFile::write( const String & /* line */ )
+{
+    throw CommonError( CommonError::WRITE_FAILED );
+}
+
+void MemoryFile::read( HeapData &buffer, unsigned maxReadSize )
+{
+    size_t bytesRead = _size - _position;
+    if ( bytesRead > maxReadSize )
+        bytesRead = maxReadSize;
+
+    buffer = ConstSimpleData( _data + _position, bytesRead );
+    _position += bytesRead;
+}
+
+String MemoryFile::readLine( char lineSeparatingChar )
+{
+    if ( _position >= _size )
+        throw CommonError( CommonError::READ_FAILED );
+
+    const char *start = _data + _position;
+    size_t remaining = _size - _position;
+    const char *separator = (const char *)memchr( start, lineSeparatingChar, remaining );
+
+    if ( separator == NULL )
+    {
+        // Last line, not terminated by a separator
+        _position = _size;
+        return String( start, remaining );
+    }
+
+    size_t length = separator - start;
+    _position += length + 1;
+    return String( start, length );
+}
+
+//
+// Local Variables:
+// compile-command: "make -C ../.. "
+// tags-file-name: "../../TAGS"
+// c-basic-offset: 4
+// End:
+//
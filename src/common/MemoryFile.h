@@ -0,0 +1,48 @@
+/*********************                                                        */
+/*! \file MemoryFile.h
+ ** \verbatim
+ ** This file is part of the Marabou project.
+ ** Copyright (c) 2017-2019 by the authors listed in the file AUTHORS
+ ** in the top-level source directory) and their institutional affiliations.
+ ** All rights reserved. See the file COPYING in the top-level source
+ ** directory for licensing information.\endverbatim
+ **
+ ** \brief A read-only IFile over a caller-owned memory buffer
+ **
+ ** The buffer (e.g., a memory-mapped file) is not copied, and must outlive
+ ** the MemoryFile object.
+ **/
+
+#ifndef __MemoryFile_h__
+#define __MemoryFile_h__
+
+#include "IFile.h"
+#include "MString.h"
+
+#include <cstddef>
+
+class MemoryFile : public IFile
+{
+public:
+    MemoryFile( const char *data, size_t size );
+    void close();
+    void open( Mode openMode );
+    void write( const String &line );
+    void read( HeapData &buffer, unsigned maxReadSize );
+    String readLine( char lineSeparatingChar = '\n' );
+
+private:
+    const char *_data;
+    size_t _size;
+    size_t _position;
+};
+
+#endif // __MemoryFile_h__
+
+//
+// Local Variables:
+// compile-command: "make -C ../.. "
+// tags-file-name: "../../TAGS"
+// c-basic-offset: 4
+// End:
+//
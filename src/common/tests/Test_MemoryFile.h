@@ -0,0 +1,72 @@
+/*********************                                                        */
+/*! \file Test_MemoryFile.h
+ ** \verbatim
+ ** This file is part of the Marabou project.
+ ** Copyright (c) 2017-2019 by the authors listed in the file AUTHORS
+ ** in the top-level source directory) and their institutional affiliations.
+ ** All rights reserved. See the file COPYING in the top-level source
+ ** directory for licensing information.\endverbatim
+ **
+ ** \brief Tests for reading lines and chunks out of a MemoryFile
+ **/
+
+#include "CommonError.h"
+#include "MString.h"
+#include "MemoryFile.h"
+
+#include <cstring>
+#include <cxxtest/TestSuite.h>
+
+class MemoryFileTestSuite : public CxxTest::TestSuite
+{
+public:
+    void test_read_line()
+    {
+        const char *data = "first line\nsecond line\n\nlast line";
+        MemoryFile file( data, strlen( data ) );
+
+        TS_ASSERT_THROWS_NOTHING( file.open( IFile::MODE_READ ) );
+
+        TS_ASSERT_EQUALS( file.readLine(), "first line" );
+        TS_ASSERT_EQUALS( file.readLine(), "second line" );
+        TS_ASSERT_EQUALS( file.readLine(), "" );
+        TS_ASSERT_EQUALS( file.readLine(), "last line" );
+
+        TS_ASSERT_THROWS_EQUALS(
+            file.readLine(), const CommonError &e, e.getCode(), CommonError::READ_FAILED );
+    }
+
+    void test_read_line_custom_separator()
+    {
+        const char *data = "1,2,3";
+        MemoryFile file( data, strlen( data ) );
+
+        TS_ASSERT_THROWS_NOTHING( file.open( IFile::MODE_READ ) );
+
+        TS_ASSERT_EQUALS( file.readLine( ',' ), "1" );
+        TS_ASSERT_EQUALS( file.readLine( ',' ), "2" );
+        TS_ASSERT_EQUALS( file.readLine( ',' ), "3" );
+    }
+
+    void test_open_for_write_fails()
+    {
+        const char *data = "";
+        MemoryFile file( data, 0 );
+
+        TS_ASSERT_THROWS_EQUALS( file.open( IFile::MODE_WRITE_TRUNCATE ),
+                                 const CommonError &e,
+                                 e.getCode(),
+                                 CommonError::OPEN_FAILED );
+
+        TS_ASSERT_THROWS_EQUALS(
+            file.readLine(), const CommonError &e, e.getCode(), CommonError::READ_FAILED );
+    }
+};
+
+//
+// Local Variables:
+// compile-command: "make -C ../../.. "
+// tags-file-name: "../../../TAGS"
+// c-basic-offset: 4
+// End:
+//
@@ -33,6 +33,11 @@ static double extractScalar( const String &token )
 }
 
 void PropertyParser::parse( const String &propertyFilePath, InputQuery &inputQuery )
+{
+    parseLines( readLines( propertyFilePath ), inputQuery );
+}
+
+List<String> PropertyParser::readLines( const String &propertyFilePath )
 {
     if ( !File::exists( propertyFilePath ) )
     {
@@ -44,6 +49,7 @@ void PropertyParser::parse( const String &propertyFilePath, InputQuery &inputQue
     File propertyFile( propertyFilePath );
     propertyFile.open( File::MODE_READ );
 
+    List<String> lines;
     try
     {
         while ( true )
@@ -51,7 +57,7 @@ void PropertyParser::parse( const String &propertyFilePath, InputQuery &inputQue
             String line = propertyFile.readLine().trim();
             if ( line.substring( 0, 2 ) != "//" )
             {
-                processSingleLine( line, inputQuery );
+                lines.append( line );
             }
         }
     }
@@ -61,6 +67,14 @@ void PropertyParser::parse( const String &propertyFilePath, InputQuery &inputQue
         if ( e.getCode() != CommonError::READ_FAILED )
             throw e;
     }
+
+    return lines;
+}
+
+void PropertyParser::parseLines( const List<String> &lines, InputQuery &inputQuery )
+{
+    for ( const auto &line : lines )
+        processSingleLine( line, inputQuery );
 }
 
 void PropertyParser::processSingleLine( const String &line, InputQuery &inputQuery )
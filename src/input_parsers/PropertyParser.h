@@ -18,6 +18,7 @@
 
 #include "Equation.h"
 #include "InputQuery.h"
+#include "List.h"
 #include "MString.h"
 
 /*
@@ -31,6 +32,13 @@ class PropertyParser
 public:
     void parse( const String &propertyFilePath, InputQuery &inputQuery );
 
+    /*
+      Read the property's lines, skipping comments. The lines can then be
+      parsed into several input queries, without reading the file again.
+    */
+    static List<String> readLines( const String &propertyFilePath );
+    void parseLines( const List<String> &lines, InputQuery &inputQuery );
+
 private:
     void processSingleLine( const String &line, InputQuery &inputQuery );
     Equation::EquationType extractRelationSymbol( const String &token );
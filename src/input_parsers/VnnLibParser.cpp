@@ -72,13 +72,13 @@ static String readVnnlibFile( const String &vnnlibFilePath )
 
 void VnnLibParser::parse( const String &vnnlibFilePath, InputQuery &inputQuery )
 {
-    String vnnlibContent = readVnnlibFile( vnnlibFilePath );
-
-    parseVnnlib( vnnlibContent, inputQuery );
+    parseTokens( tokenize( vnnlibFilePath ), inputQuery );
 }
 
-void VnnLibParser::parseVnnlib( const String &vnnlibContent, InputQuery &inputQuery )
+Vector<String> VnnLibParser::tokenize( const String &vnnlibFilePath )
 {
+    String vnnlibContent = readVnnlibFile( vnnlibFilePath );
+
     std::regex re( R"(\(|\)|[\w\-\\.]+|<=|>=|\+|-|\*)" );
 
     auto tokens_begin = std::cregex_token_iterator(
@@ -95,7 +95,13 @@ void VnnLibParser::parseVnnlib( const String &vnnlibContent, InputQuery &inputQu
         all_tokens.append( match_str );
     }
 
-    parseScript( all_tokens, inputQuery );
+    return all_tokens;
+}
+
+void VnnLibParser::parseTokens( const Vector<String> &tokens, InputQuery &inputQuery )
+{
+    _varMap.clear();
+    parseScript( tokens, inputQuery );
 }
 
 int VnnLibParser::parseScript( const Vector<String> &tokens, InputQuery &inputQuery )
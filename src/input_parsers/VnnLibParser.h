@@ -26,6 +26,13 @@ class VnnLibParser
 public:
     void parse( const String &vnnlibFilePath, InputQuery &inputQuery );
 
+    /*
+      Read and tokenize a vnnlib file. The tokens can then be parsed into
+      several input queries, without reading and tokenizing the file again.
+    */
+    static Vector<String> tokenize( const String &vnnlibFilePath );
+    void parseTokens( const Vector<String> &tokens, InputQuery &inputQuery );
+
 private:
     class Term
     {
@@ -45,8 +52,6 @@ private:
 
     Map<String, unsigned int> _varMap;
 
-    void parseVnnlib( const String &vnnlibContent, InputQuery &inputQuery );
-
     int parseScript( const Vector<String> &tokens, InputQuery &inputQuery );
 
     int parseCommand( int index, const Vector<String> &tokens, InputQuery &inputQuery );
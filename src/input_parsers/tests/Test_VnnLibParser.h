@@ -64,6 +64,36 @@ public:
         TS_ASSERT( upperBounds.exists( outputVar ) && upperBounds.get( outputVar ) == -1 )
     }
 
+    void test_parse_tokens_into_several_queries()
+    {
+        String queryPath =
+            Stringf( "%s/%s", RESOURCES_DIR "/onnx/vnnlib", "test_nano_vnncomp.vnnlib" );
+        String onnxPath =
+            Stringf( "%s/%s", RESOURCES_DIR "/onnx/vnnlib", "test_nano_vnncomp.onnx" );
+
+        Vector<String> tokens;
+        TS_ASSERT_THROWS_NOTHING( tokens = VnnLibParser::tokenize( queryPath ) );
+
+        for ( unsigned i = 0; i < 2; ++i )
+        {
+            InputQuery query;
+            InputQueryBuilder queryBuilder;
+            TS_ASSERT_THROWS_NOTHING( OnnxParser::parse( queryBuilder, onnxPath, {}, {} ) );
+            queryBuilder.generateQuery( query );
+            TS_ASSERT_THROWS_NOTHING( VnnLibParser().parseTokens( tokens, query ) );
+
+            unsigned int inputVar = query.inputVariableByIndex( 0 );
+            unsigned int outputVar = query.outputVariableByIndex( 0 );
+
+            const auto &lowerBounds = query.getLowerBounds();
+            const auto &upperBounds = query.getUpperBounds();
+
+            TS_ASSERT( lowerBounds.exists( inputVar ) && lowerBounds.get( inputVar ) == -1 )
+            TS_ASSERT( upperBounds.exists( inputVar ) && upperBounds.get( inputVar ) == 1 )
+            TS_ASSERT( upperBounds.exists( outputVar ) && upperBounds.get( outputVar ) == -1 )
+        }
+    }
+
     void test_tiny_vnncomp()
     {
         parse( "test_tiny_vnncomp.vnnlib", "test_tiny_vnncomp.onnx" );
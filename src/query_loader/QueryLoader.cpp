@@ -27,6 +27,7 @@
 #include "MStringf.h"
 #include "MarabouError.h"
 #include "MaxConstraint.h"
+#include "MemoryFile.h"
 #include "ReluConstraint.h"
 #include "RoundConstraint.h"
 #include "SignConstraint.h"
@@ -40,15 +41,27 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
                             Stringf( "File %s not found.\n", fileName.ascii() ).ascii() );
     }
 
-    InputQuery inputQuery;
     AutoFile input( fileName );
     input->open( IFile::MODE_READ );
+    return parseQuery( input );
+}
+
+InputQuery QueryLoader::loadQueryFromBuffer( const char *data, size_t size )
+{
+    MemoryFile input( data, size );
+    input.open( IFile::MODE_READ );
+    return parseQuery( input );
+}
+
+InputQuery QueryLoader::parseQuery( IFile &input )
+{
+    InputQuery inputQuery;
 
-    unsigned numVars = atoi( input->readLine().trim().ascii() );
-    unsigned numLowerBounds = atoi( input->readLine().trim().ascii() );
-    unsigned numUpperBounds = atoi( input->readLine().trim().ascii() );
-    unsigned numEquations = atoi( input->readLine().trim().ascii() );
-    unsigned numConstraints = atoi( input->readLine().trim().ascii() );
+    unsigned numVars = atoi( input.readLine().trim().ascii() );
+    unsigned numLowerBounds = atoi( input.readLine().trim().ascii() );
+    unsigned numUpperBounds = atoi( input.readLine().trim().ascii() );
+    unsigned numEquations = atoi( input.readLine().trim().ascii() );
+    unsigned numConstraints = atoi( input.readLine().trim().ascii() );
 
     QL_LOG( Stringf( "Number of variables: %u\n", numVars ).ascii() );
     QL_LOG( Stringf( "Number of lower bounds: %u\n", numLowerBounds ).ascii() );
@@ -59,10 +72,10 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     inputQuery.setNumberOfVariables( numVars );
 
     // Input Variables
-    unsigned numInputVars = atoi( input->readLine().trim().ascii() );
+    unsigned numInputVars = atoi( input.readLine().trim().ascii() );
     for ( unsigned i = 0; i < numInputVars; ++i )
     {
-        String line = input->readLine();
+        String line = input.readLine();
         List<String> tokens = line.tokenize( "," );
         auto it = tokens.begin();
         unsigned inputIndex = atoi( it->ascii() );
@@ -73,10 +86,10 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     }
 
     // Output Variables
-    unsigned numOutputVars = atoi( input->readLine().trim().ascii() );
+    unsigned numOutputVars = atoi( input.readLine().trim().ascii() );
     for ( unsigned i = 0; i < numOutputVars; ++i )
     {
-        String line = input->readLine();
+        String line = input.readLine();
         List<String> tokens = line.tokenize( "," );
         auto it = tokens.begin();
         unsigned outputIndex = atoi( it->ascii() );
@@ -90,7 +103,7 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     for ( unsigned i = 0; i < numLowerBounds; ++i )
     {
         QL_LOG( Stringf( "Bound: %u\n", i ).ascii() );
-        String line = input->readLine();
+        String line = input.readLine();
         List<String> tokens = line.tokenize( "," );
 
         // format: <var, lb>
@@ -111,7 +124,7 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     for ( unsigned i = 0; i < numUpperBounds; ++i )
     {
         QL_LOG( Stringf( "Bound: %u\n", i ).ascii() );
-        String line = input->readLine();
+        String line = input.readLine();
         List<String> tokens = line.tokenize( "," );
 
         // format: <var, ub>
@@ -132,7 +145,7 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     for ( unsigned i = 0; i < numEquations; ++i )
     {
         QL_LOG( Stringf( "Equation: %u ", i ).ascii() );
-        String line = input->readLine();
+        String line = input.readLine();
 
         List<String> tokens = line.tokenize( "," );
         ASSERT( tokens.size() > 4 );
@@ -191,7 +204,7 @@ InputQuery QueryLoader::loadQuery( const String &fileName )
     // Non-Linear(Piecewise and Nonlinear) Constraints
     for ( unsigned i = 0; i < numConstraints; ++i )
     {
-        String line = input->readLine();
+        String line = input.readLine();
 
         List<String> tokens = line.tokenize( "," );
         auto it = tokens.begin();
@@ -17,8 +17,11 @@
 #ifndef __QueryLoader_h__
 #define __QueryLoader_h__
 
+#include "IFile.h"
 #include "InputQuery.h"
 
+#include <cstddef>
+
 #define QL_LOG( x, ... ) LOG( GlobalConfiguration::QUERY_LOADER_LOGGING, "QueryLoader: %s\n", x )
 
 class QueryLoader
@@ -32,6 +35,15 @@ public:
       Parse a serialized query and return it in InputQuery form
     */
     static InputQuery loadQuery( const String &fileName );
+
+    /*
+      Parse a serialized query held in memory (e.g., a memory-mapped
+      file) and return it in InputQuery form. The buffer is not copied.
+    */
+    static InputQuery loadQueryFromBuffer( const char *data, size_t size );
+
+private:
+    static InputQuery parseQuery( IFile &input );
 };
 
 #endif // __QueryLoader_h__